@@ -7,72 +7,101 @@
 //
 // Results are cached to _build/cache/issue-board.json so GitHub API calls
 // only happen once per build. Delete the cache file to force a refetch.
+//
+// Requires the GitHub CLI (`gh`) 2.48 or newer, for `gh api --slurp`. With an older
+// gh the fetch fails with "unknown flag: --slurp" and the boards render empty.
+// The whole board (every item's body, from every repo) arrives in that one stdout,
+// capped by BOARD_MAX_BUFFER (256 MB); past it the fetch fails with ENOBUFS, also rendering
+// empty boards. Raise the cap if the board grows that large.
 
-import { execSync } from "child_process";
+import { execFileSync } from "child_process";
 import { readFileSync, writeFileSync, mkdirSync } from "fs";
 import { dirname } from "path";
 
 const CACHE_PATH = "_build/cache/issue-board.json";
+const INITIATIVES_REPO = "2i2c-org/initiatives";
+const PLATFORM_LABEL = "type:platform";
+// Output caps for `gh`: one call's worth by default, and the full paginated board
+const GH_MAX_BUFFER = 10 * 1024 * 1024;
+const BOARD_MAX_BUFFER = 256 * 1024 * 1024;
 
-function ghGraphQL(query) {
-  const result = execSync(`gh api graphql -f query='${query}'`, {
+// Run `gh` directly (no intermediate shell) with arguments passed verbatim.
+// `input` is written to gh's stdin.
+function gh(args, { input, maxBuffer = GH_MAX_BUFFER } = {}) {
+  return execFileSync("gh", args, {
     encoding: "utf-8",
-    maxBuffer: 10 * 1024 * 1024,
+    input,
+    maxBuffer,
   });
-  return JSON.parse(result).data;
 }
 
+// `--paginate` makes gh follow pageInfo.endCursor (bound to $endCursor) itself,
+// and `--slurp` returns every page's response as one JSON array.
+// The query is read from stdin (`query=@-`) so it doesn't have to fit in argv.
+function ghGraphQLPages(query) {
+  const args = ["api", "graphql", "--paginate", "--slurp", "-F", "query=@-"];
+  return JSON.parse(gh(args, { input: query, maxBuffer: BOARD_MAX_BUFFER }))
+    .map((page) => page.data);
+}
+
+// Only fields that render.mjs / plugin.mjs consume. Sub-issues are shown as bare
+// URLs (the github-issue-link plugin fetches their titles), so we skip their titles.
 const ISSUE_FRAGMENT = `
-  title url body updatedAt closedAt stateReason
+  title url body closedAt stateReason
   repository { nameWithOwner }
   labels(first: 10) { nodes { name } }
-  subIssues(first: 20) { nodes { title state url updatedAt } }
+  subIssues(first: 20) { nodes { state url updatedAt } }
 `;
 
-function fetchProjectItems(cursor) {
-  const after = cursor ? `, after: "${cursor}"` : "";
-  const query = `{
-    organization(login: "2i2c-org") {
-      projectV2(number: 57) {
-        items(first: 100${after}, orderBy: {field: POSITION, direction: ASC}) {
-          pageInfo { hasNextPage endCursor }
-          nodes {
-            fieldValueByName(name: "Status") {
-              ... on ProjectV2ItemFieldSingleSelectValue { name }
-            }
-            content {
-              ... on Issue { ${ISSUE_FRAGMENT} }
-            }
+// gh fills in $endCursor from each page's pageInfo when paginating
+const PROJECT_ITEMS_QUERY = `query($endCursor: String) {
+  organization(login: "2i2c-org") {
+    projectV2(number: 57) {
+      items(first: 100, after: $endCursor, orderBy: {field: POSITION, direction: ASC}) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          fieldValueByName(name: "Status") {
+            ... on ProjectV2ItemFieldSingleSelectValue { name }
+          }
+          content {
+            ... on Issue { ${ISSUE_FRAGMENT} }
           }
         }
       }
     }
-  }`;
-  return ghGraphQL(query).organization.projectV2.items;
+  }
+}`;
+
+// All board items, fetched with a single `gh` invocation
+function fetchProjectItems() {
+  return ghGraphQLPages(PROJECT_ITEMS_QUERY)
+    .flatMap((data) => data.organization.projectV2.items.nodes);
 }
 
-function paginate(fetchFn) {
-  const allNodes = [];
-  let cursor = null;
-  do {
-    const page = fetchFn(cursor);
-    allNodes.push(...page.nodes);
-    cursor = page.pageInfo.hasNextPage ? page.pageInfo.endCursor : null;
-  } while (cursor);
-  return allNodes;
+// Initiatives live in the /initiatives repo; older ones carry a type:platform label.
+// Checked on the raw GraphQL node so we only normalize items we keep. The repo
+// check is a single comparison, so it runs first and the label scan is the fallback.
+function isInitiative(node) {
+  return (
+    node.repository?.nameWithOwner === INITIATIVES_REPO ||
+    (node.labels?.nodes || []).some((l) => l.name === PLATFORM_LABEL)
+  );
 }
 
-// Flatten GitHub's nested GraphQL response into a simple object
+// Leading "[Tag]" prefix that initiative titles carry on GitHub
+const TITLE_PREFIX_PATTERN = /^\[.*?\]\s*/;
+
+// Flatten GitHub's nested GraphQL response into a simple object.
+// Also used for candidates, which only lack the board-specific fields.
 function normalizeItem(node, status) {
   return {
-    title: node.title.replace(/^\[.*?\]\s*/g, "").trim(),
+    title: node.title.replace(TITLE_PREFIX_PATTERN, "").trim(),
     url: node.url,
     status,
     stateReason: node.stateReason || "",
     labels: (node.labels?.nodes || []).map((l) => l.name),
     body: node.body,
-    updatedAt: node.updatedAt,
-    closedAt: node.closedAt,
+    closedAt: node.closedAt || null,
     subIssues: (node.subIssues?.nodes || []).filter(Boolean),
   };
 }
@@ -92,14 +121,16 @@ export function fetchData() {
 
   console.log("issue-board: fetching from GitHub...");
 
-  // Normalize first, then filter to initiatives repo or type:platform label
-  const allItems = paginate(fetchProjectItems)
-    .filter((node) => node.content?.title)
-    .map((node) => normalizeItem(node.content, node.fieldValueByName?.name || ""));
-
-  cachedItems = allItems.filter((item) =>
-    item.url.includes("2i2c-org/initiatives") || item.labels.includes("type:platform")
-  );
+  // Filter to initiatives repo or type:platform label, normalizing in the same pass.
+  // Board items that aren't issues (e.g. drafts) come back with empty content.
+  // The full list (board + candidates) is built locally and only memoized once every
+  // fetch has succeeded, so a failure leaves nothing partial behind and later
+  // directives retry.
+  const items = [];
+  for (const { content, fieldValueByName } of fetchProjectItems()) {
+    if (!content?.title || !isInitiative(content)) continue;
+    items.push(normalizeItem(content, fieldValueByName?.name || ""));
+  }
 
   /**
    * Fetch candidate initiatives
@@ -109,12 +140,12 @@ export function fetchData() {
    * - Are NOT on the project board
    * - Have no error labels from the initiatives linter
    */
-  const boardUrls = new Set(cachedItems.map((item) => item.url));
+  const boardUrls = new Set(items.map((item) => item.url));
   // Grab all open issues in the initiatives repo
-  const candidateJson = execSync(
-    `gh issue list --repo 2i2c-org/initiatives --state open --json url,title,body,updatedAt,labels --limit 200`,
-    { encoding: "utf-8" },
-  );
+  const candidateJson = gh([
+    "issue", "list", "--repo", INITIATIVES_REPO, "--state", "open",
+    "--json", "url,title,body,labels", "--limit", "200",
+  ]);
   const allRepoIssues = JSON.parse(candidateJson);
   // Filter to only those that are candidates
   const candidates = allRepoIssues
@@ -122,21 +153,13 @@ export function fetchData() {
     .filter((issue) => !boardUrls.has(issue.url))
     // Exclude issues failing the linter
     .filter((issue) => !issue.labels.some((l) => l.name.startsWith("error:")))
-    // Reformat like the other initiatives we've prepped
-    .map((issue) => ({
-      title: issue.title.replace(/^\[.*?\]\s*/g, "").trim(),
-      url: issue.url,
-      status: "Candidate",
-      stateReason: "",
-      labels: issue.labels.map((l) => l.name),
-      body: issue.body,
-      updatedAt: issue.updatedAt,
-      closedAt: null,
-      subIssues: [],
-    }));
-  cachedItems.push(...candidates);
+    // Reformat like the other initiatives we've prepped (`gh issue list` returns flat label lists)
+    .map((issue) => normalizeItem({ ...issue, labels: { nodes: issue.labels } }, "Candidate"));
+  items.push(...candidates);
 
+  cachedItems = items;
   mkdirSync(dirname(CACHE_PATH), { recursive: true });
-  writeFileSync(CACHE_PATH, JSON.stringify(cachedItems, null, 2));
+  // Compact JSON: the cache is machine-read, and indentation only adds bytes to parse
+  writeFileSync(CACHE_PATH, JSON.stringify(cachedItems));
   return cachedItems;
 }
@@ -8,6 +8,24 @@
 import { fetchData } from "./fetch.mjs";
 import { renderItem } from "./render.mjs";
 
+// Items grouped by lowercased status, built once per fetched dataset so each
+// {issue-board} directive looks up its status instead of rescanning every item.
+const itemsByStatus = new WeakMap();
+
+function groupByStatus(allItems) {
+  let groups = itemsByStatus.get(allItems);
+  if (!groups) {
+    groups = new Map();
+    for (const item of allItems) {
+      const key = item.status.toLowerCase();
+      if (!groups.has(key)) groups.set(key, []);
+      groups.get(key).push(item);
+    }
+    itemsByStatus.set(allItems, groups);
+  }
+  return groups;
+}
+
 const issueBoardDirective = {
   name: "issue-board",
   doc: "Display initiatives from the 2i2c project board filtered by status.",
@@ -21,15 +39,19 @@ const issueBoardDirective = {
       return [];
     }
 
-    let filtered = allItems.filter(
-      (item) => item.status.toLowerCase() === data.arg.toLowerCase(),
-    );
+    // Board status names are matched case-insensitively.
+    // "Done" items: only show completed (not duplicated/not-planned).
+    const isDone = data.arg === "Done";
+    const matching = groupByStatus(allItems).get(data.arg.toLowerCase()) || [];
+    const filtered = isDone
+      ? matching.filter((item) => item.stateReason === "COMPLETED")
+      : matching;
 
-    // "Done" items: only show completed (not duplicated/not-planned), newest first
-    if (data.arg === "Done") {
-      filtered = filtered
-        .filter((item) => item.stateReason === "COMPLETED")
-        .sort((a, b) => new Date(b.closedAt || 0) - new Date(a.closedAt || 0));
+    // "Done" items are shown newest first.
+    // GitHub timestamps are UTC ISO 8601 strings, so they sort chronologically as
+    // plain strings and we don't need to parse a Date on every comparison.
+    if (isDone) {
+      filtered.sort((a, b) => (b.closedAt || "").localeCompare(a.closedAt || ""));
     }
 
     return [{
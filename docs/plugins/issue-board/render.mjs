@@ -7,6 +7,10 @@
 
 const SHOW_THEME_BADGES = false;
 
+// Pre-filled funding interest form; each item appends its own title and URL
+const FUNDING_FORM_URL =
+  "https://docs.google.com/forms/d/e/1FAIpQLScItiSZ9l2cqtpw5T3bVejFIQ3-cz15EESt_P3PczUWMScXTA/viewform?usp=pp_url";
+
 // 2i2c brand colors for theme badges — see https://2i2c.org/brand
 // TODO: These aren't currently used, because badges are hidden behind a feature flag
 //   Re-activate it when this issue is resolved https://github.com/2i2c-org/infrastructure/issues/7858
@@ -21,6 +25,8 @@ const THEME_COLORS = {
   "analytics":              { bg: "#230344", fg: "#fff" },
 };
 
+const THEME_PREFIX = "theme:";
+
 function badgeStyle(theme) {
   const c = THEME_COLORS[theme] || { bg: "#230344", fg: "#fff" };
   return {
@@ -30,9 +36,10 @@ function badgeStyle(theme) {
   };
 }
 
-export function formatTimeAgo(isoDate, prefix = "Updated") {
+// `now` can be passed in so a batch of labels shares one clock read
+export function formatTimeAgo(isoDate, prefix = "Updated", now = Date.now()) {
   if (!isoDate) return null;
-  const diffDays = Math.floor((Date.now() - new Date(isoDate)) / 86400000);
+  const diffDays = Math.floor((now - Date.parse(isoDate)) / 86400000);
   if (diffDays === 0) return `${prefix} today`;
   if (diffDays === 1) return `${prefix} 1d ago`;
   if (diffDays < 30) return `${prefix} ${diffDays}d ago`;
@@ -43,17 +50,39 @@ export function formatTimeAgo(isoDate, prefix = "Updated") {
 // Extract the raw markdown between a "## Problem Statement" header and the next header.
 const HEADER_PATTERN = /^#{1,4}\s*problem\s*statement/i;
 const NEXT_HEADER_PATTERN = /^#{1,4}\s/;
+// Candidate header text, used to jump straight to possible header lines
+const PROBLEM_STATEMENT_PATTERN = /problem\s*statement/gi;
+
+// End index of the line containing `index` (exclusive of "\n")
+function lineEnd(body, index) {
+  const end = body.indexOf("\n", index);
+  return end === -1 ? body.length : end;
+}
 
 function extractProblemStatement(body) {
   if (!body) return null;
-  const lines = body.split("\n");
-  let foundHeader = false;
-  const sectionLines = [];
 
-  for (const line of lines) {
+  // Find the header line by jumping between "problem statement" matches instead of
+  // trimming every line, then start reading at the line after it.
+  let start = -1;
+  PROBLEM_STATEMENT_PATTERN.lastIndex = 0;
+  let match;
+  while ((match = PROBLEM_STATEMENT_PATTERN.exec(body))) {
+    const end = lineEnd(body, match.index);
+    const line = body.slice(body.lastIndexOf("\n", match.index) + 1, end);
+    if (HEADER_PATTERN.test(line.trim())) { start = end + 1; break; }
+    PROBLEM_STATEMENT_PATTERN.lastIndex = end + 1;
+  }
+  if (start === -1) return null;
+
+  // Walk lines from there, stopping at the next header; the rest of the body is never read
+  const sectionLines = [];
+  while (start <= body.length) {
+    const end = lineEnd(body, start);
+    const line = body.slice(start, end);
+    start = end + 1;
     const trimmed = line.trim();
-    if (HEADER_PATTERN.test(trimmed)) { foundHeader = true; continue; }
-    if (!foundHeader) continue;
+    if (HEADER_PATTERN.test(trimmed)) continue;
     if (trimmed === "" && sectionLines.length === 0) continue;
     if (NEXT_HEADER_PATTERN.test(trimmed)) break;
     sectionLines.push(line);
@@ -65,6 +94,7 @@ function extractProblemStatement(body) {
 
 // Render the item as AST nodes for MyST
 export function renderItem(item, ctx) {
+  const now = Date.now();
   const summaryChildren = [
     { type: "link", url: item.url, children: [{ type: "text", value: item.title }] },
   ];
@@ -73,8 +103,9 @@ export function renderItem(item, ctx) {
   const rightChildren = [];
   // TODO: FEATURE FLAG: badges are currently disabled (see TODO above)
   if (SHOW_THEME_BADGES) {
-    for (const label of item.labels.filter((l) => l.startsWith("theme:"))) {
-      const theme = label.replace(/^theme:/, "");
+    for (const label of item.labels) {
+      if (!label.startsWith(THEME_PREFIX)) continue;
+      const theme = label.slice(THEME_PREFIX.length);
       rightChildren.push({
         type: "span", style: badgeStyle(theme),
         children: [{ type: "text", value: theme }],
@@ -105,7 +136,7 @@ export function renderItem(item, ctx) {
   // CTA button for non-completed items (visible on hover, only icon is always visible on touchscreen)
   if (item.status !== "Done") {
     rightChildren.push({
-      type: "link", url: `https://docs.google.com/forms/d/e/1FAIpQLScItiSZ9l2cqtpw5T3bVejFIQ3-cz15EESt_P3PczUWMScXTA/viewform?usp=pp_url&entry.1768292423=${encodeURIComponent(item.title)}&entry.384914845=${encodeURIComponent(item.url)}`, class: "issue-board-cta",
+      type: "link", url: `${FUNDING_FORM_URL}&entry.1768292423=${encodeURIComponent(item.title)}&entry.384914845=${encodeURIComponent(item.url)}`, class: "issue-board-cta",
       children: [
         { type: "span", class: "issue-board-cta-text", children: [{ type: "text", value: "Fund this " }] },
         { type: "span", class: "issue-board-cta-icon", children: [{ type: "text", value: "💰" }] },
@@ -114,7 +145,7 @@ export function renderItem(item, ctx) {
   }
 
   if (item.status === "Done") {
-    const label = formatTimeAgo(item.closedAt, "Completed");
+    const label = formatTimeAgo(item.closedAt, "Completed", now);
     if (label) {
       rightChildren.push({
         type: "span", class: "issue-board-updated",
@@ -159,7 +190,7 @@ export function renderItem(item, ctx) {
         const children = [
           { type: "link", url: sub.url, children: [{ type: "text", value: sub.url }] },
         ];
-        const subUpdated = formatTimeAgo(sub.updatedAt);
+        const subUpdated = formatTimeAgo(sub.updatedAt, "Updated", now);
         if (subUpdated) {
           children.push({
             type: "span", class: "issue-board-updated",
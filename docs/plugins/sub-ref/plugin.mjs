@@ -8,7 +8,8 @@ const subRefRole = {
       return [
         {
           type: 'text',
-          value: new Date().toISOString().split('T')[0],
+          // toISOString() is always YYYY-MM-DDTHH:mm:ss.sssZ, so the date is the first 10 chars
+          value: new Date().toISOString().slice(0, 10),
         },
       ];
     }